@@ -10,14 +10,16 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.core.security import (
     create_access_token,
-    get_current_user,
+    get_current_user_full,
     hash_password,
-    verify_password,
+    verify_and_update_password,
 )
 from app.database import get_session
 from app.models import User
@@ -25,6 +27,17 @@ from app.schemas.user import Token, UserCreate, UserResponse
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
+# ── Hoisted statements ──────────────────────────────────────────
+# Built once at import; per-request code only binds parameters, which
+# skips re-building the select() object tree on the login hot path.
+# Login only needs id + password_hash — fetching the full row wastes
+# wire bytes and hydration on every attempt.
+_STMT_LOGIN_LOOKUP = (
+    select(User.id, User.password_hash)
+    .where(func.lower(User.email) == bindparam("email"))
+    .limit(1)
+)
+
 
 # ═══════════════════════════════════════════════════════════════════
 # REGISTER
@@ -44,34 +57,39 @@ async def register(
     Register a new user.
 
     - Validates the input via `UserCreate` schema.
-    - Checks for duplicate emails.
     - Hashes the password before storing.
     - Returns the created user (without password_hash).
+
+    Duplicate detection rides on the unique index on `users.email`:
+    a single `INSERT ... ON CONFLICT DO NOTHING RETURNING` replaces the
+    old SELECT-then-INSERT pair, saving one DB round-trip.
     """
-    # ── Check for duplicate email ───────────────────────────────
-    stmt = select(User).where(User.email == user_in.email)
-    result = await session.execute(stmt)
-    existing_user = result.scalar_one_or_none()
+    stmt = (
+        pg_insert(User)
+        .values(
+            # EmailField already lowercased the address at validation.
+            email=user_in.email,
+            password_hash=await hash_password(user_in.password),
+            full_name=user_in.full_name,
+            city=user_in.city,
+            phone_number=user_in.phone_number,
+            role=user_in.role,
+        )
+        # The only unique constraints on users are the PK and the
+        # lower(email) expression index, so a bare DO NOTHING is safe.
+        .on_conflict_do_nothing()
+        .returning(User)
+    )
+    result = await session.scalars(stmt)
+    db_user = result.first()
 
-    if existing_user:
+    if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A user with this email already exists.",
         )
 
-    # ── Create and persist ──────────────────────────────────────
-    db_user = User(
-        email=user_in.email,
-        password_hash=hash_password(user_in.password),
-        full_name=user_in.full_name,
-        city=user_in.city,
-        phone_number=user_in.phone_number,
-        role=user_in.role,
-    )
-    session.add(db_user)
     await session.commit()
-    await session.refresh(db_user)
-
     return db_user
 
 
@@ -96,21 +114,39 @@ async def login(
 
     Returns a JWT access token on success.
     """
-    # ── Find user by email ──────────────────────────────────────
-    stmt = select(User).where(User.email == form_data.username)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+    # ── Find user by email (unique index — at most one row) ─────
+    result = await session.execute(
+        _STMT_LOGIN_LOOKUP, {"email": form_data.username.lower()}
+    )
+    row = result.first()
 
     # ── Verify credentials ──────────────────────────────────────
-    if not user or not verify_password(form_data.password, user.password_hash):
+    valid, new_hash = False, None
+    if row:
+        valid, new_hash = await verify_and_update_password(
+            form_data.password, row.password_hash
+        )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password.",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # ── Upgrade legacy hashes ───────────────────────────────────
+    # passlib hands back a replacement argon2id hash when the stored
+    # one uses a deprecated scheme (bcrypt). Persist it so this
+    # account stops paying the bcrypt cost on every login.
+    if new_hash is not None:
+        await session.execute(
+            update(User)
+            .where(User.id == row.id)
+            .values(password_hash=new_hash)
+        )
+        await session.commit()
+
     # ── Issue token ─────────────────────────────────────────────
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data={"sub": str(row.id)})
 
     return Token(access_token=access_token)
 
@@ -125,15 +161,15 @@ async def login(
     summary="Get the currently authenticated user's profile",
 )
 async def get_me(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[User, Depends(get_current_user_full)],
 ):
     """
     **Protected endpoint** — requires a valid JWT in the `Authorization` header.
 
     Returns the full profile of the currently authenticated user.
-    Uses the `get_current_user` dependency which:
+    Uses the `get_current_user_full` dependency which:
     1. Extracts the Bearer token
     2. Decodes the JWT
-    3. Fetches the user from the database
+    3. Fetches the full user row from the database
     """
     return current_user
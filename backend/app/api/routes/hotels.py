@@ -6,20 +6,27 @@ GET    /api/hotels                     — List all hotels (public)
 GET    /api/hotels/my/hotels           — Get hotels owned by current user (protected)
 GET    /api/hotels/{hotel_id}          — Get a hotel with rooms (public)
 POST   /api/hotels/{hotel_id}/rooms    — Add a room to a hotel (owner only)
+POST   /api/hotels/{hotel_id}/rooms/bulk — Add many rooms in one request (owner only)
 """
 
+from datetime import datetime
+from types import SimpleNamespace
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import bindparam, func, insert, literal, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from sqlmodel import select
 
 from app.core.security import RoleChecker, get_current_user
 from app.database import get_session
-from app.models import Hotel, Room, User, UserRole
+from app.models import Hotel, HotelImage, Room, UserRole
 from app.schemas.hotel import (
+    HOTEL_LIST_ADAPTER,
     HotelCreate,
+    HotelListCursor,
+    HotelListPage,
     HotelListResponse,
     HotelResponse,
     RoomCreate,
@@ -31,6 +38,32 @@ router = APIRouter(prefix="/api/hotels", tags=["Hotels"])
 # ── Reusable RBAC dependency ────────────────────────────────────
 require_hotel_role = RoleChecker([UserRole.HOTEL_OWNER, UserRole.ADMIN])
 
+# ── Hoisted statements ──────────────────────────────────────────
+# Built once at import; per-request code only binds parameters. The
+# public listing stays dynamic (city/cursor combinations) and relies on
+# SQLAlchemy's compiled-statement cache instead.
+_STMT_HOTEL_DETAIL = (
+    select(Hotel)
+    .where(Hotel.id == bindparam("hotel_id"))
+    .options(
+        joinedload(Hotel.rooms),  # type: ignore[arg-type]
+        selectinload(Hotel.image_rows),  # type: ignore[arg-type]
+        raiseload("*"),
+    )
+)
+
+_STMT_MY_HOTELS = (
+    select(Hotel)
+    .where(Hotel.owner_id == bindparam("owner_id"))
+    .options(
+        selectinload(Hotel.rooms),  # type: ignore[arg-type]
+        selectinload(Hotel.image_rows),  # type: ignore[arg-type]
+        raiseload("*"),
+    )
+    .order_by(Hotel.created_at.desc())
+    .limit(100)
+)
+
 
 # ═══════════════════════════════════════════════════════════════════
 # CREATE HOTEL
@@ -44,7 +77,7 @@ require_hotel_role = RoleChecker([UserRole.HOTEL_OWNER, UserRole.ADMIN])
 )
 async def create_hotel(
     hotel_in: HotelCreate,
-    current_user: Annotated[User, Depends(require_hotel_role)],
+    current_user: Annotated[SimpleNamespace, Depends(require_hotel_role)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
     """
@@ -59,11 +92,15 @@ async def create_hotel(
         location=hotel_in.location,
         city=hotel_in.city,
         description=hotel_in.description,
-        images=hotel_in.images,
     )
+    # ordering_list assigns each image's position from its list index.
+    db_hotel.image_rows = [
+        HotelImage(url=url) for url in hotel_in.images or []
+    ]
     session.add(db_hotel)
     await session.commit()
-    await session.refresh(db_hotel)
+    # No refresh needed: the INSERT's RETURNING populates the id, and
+    # expire_on_commit=False keeps the remaining attributes loaded.
 
     return db_hotel
 
@@ -74,25 +111,70 @@ async def create_hotel(
 
 @router.get(
     "",
-    response_model=list[HotelListResponse],
-    summary="List all hotels",
+    # Serialization happens once below via HotelListPage; response_model
+    # would only repeat the same validation a second time. `responses`
+    # keeps the page schema in OpenAPI so docs and the hand-written TS
+    # client in web/src/lib/api.ts have a contract to check against.
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": HotelListPage}},
+    summary="List hotels (paginated)",
 )
 async def list_hotels(
     session: Annotated[AsyncSession, Depends(get_session)],
     city: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: datetime | None = None,
+    cursor_id: int | None = None,
 ):
     """
-    **Public** — Returns all hotels. Optionally filter by `city`.
-
-    Uses `HotelListResponse` (no rooms) to keep the payload light.
+    **Public** — Returns hotels newest-first, one page at a time.
+    Optionally filter by `city`.
+
+    Keyset pagination: pass the previous page's `next_cursor` fields
+    back as `cursor` + `cursor_id` to continue. Unlike OFFSET, this
+    stays cheap no matter how deep the client paginates, and an
+    unbounded listing can no longer hydrate the whole table into one
+    response. The cursor is the `(created_at, id)` pair — `created_at`
+    alone can't resume a page, because `now()` is transaction-stable
+    and batch-inserted rows all tie on it.
+
+    The city filter is a case-insensitive exact match served by the
+    `lower(city)` expression index — the old `ILIKE '%...%'` forced a
+    sequential scan on every request.
     """
-    stmt = select(Hotel).order_by(Hotel.created_at.desc())
+    # HotelListResponse never serializes rooms — raiseload guarantees
+    # nothing accidentally traverses the relationship on this hot path.
+    stmt = (
+        select(Hotel)
+        .options(raiseload(Hotel.rooms))  # type: ignore[arg-type]
+        .order_by(Hotel.created_at.desc(), Hotel.id.desc())
+        .limit(limit)
+    )
     if city:
-        stmt = stmt.where(Hotel.city.ilike(f"%{city}%"))
+        stmt = stmt.where(func.lower(Hotel.city) == city.lower())
+    if cursor is not None and cursor_id is not None:
+        # Row-value comparison — matches the DESC, DESC ordering above.
+        stmt = stmt.where(
+            tuple_(Hotel.created_at, Hotel.id) < (cursor, cursor_id)
+        )
 
     result = await session.execute(stmt)
     hotels = result.scalars().all()
-    return hotels
+
+    last = hotels[-1] if len(hotels) == limit else None
+    # model_construct skips re-validating the adapter-validated items;
+    # one dump pass produces the documented HotelListPage shape.
+    page = HotelListPage.model_construct(
+        items=HOTEL_LIST_ADAPTER.validate_python(hotels, from_attributes=True),
+        next_cursor=(
+            HotelListCursor.model_construct(
+                created_at=last.created_at, id=last.id
+            )
+            if last
+            else None
+        ),
+    )
+    return page.model_dump(mode="json")
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -107,20 +189,21 @@ async def list_hotels(
     summary="Get hotels owned by the current user",
 )
 async def get_my_hotels(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[SimpleNamespace, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
     """
-    **Protected** — Returns all hotels owned by the authenticated user,
-    including their rooms. Used by the hotel owner dashboard.
+    **Protected** — Returns the hotels owned by the authenticated user
+    (capped at 100), including their rooms. Used by the hotel owner
+    dashboard.
+
+    `raiseload('*')` turns any accidental lazy load of other
+    relationships (e.g. `hotel.owner`) into a loud error instead of a
+    silent N+1.
     """
-    stmt = (
-        select(Hotel)
-        .where(Hotel.owner_id == current_user.id)
-        .options(selectinload(Hotel.rooms))  # type: ignore[arg-type]
-        .order_by(Hotel.created_at.desc())
+    result = await session.execute(
+        _STMT_MY_HOTELS, {"owner_id": current_user.id}
     )
-    result = await session.execute(stmt)
     hotels = result.scalars().all()
     return hotels
 
@@ -141,16 +224,14 @@ async def get_hotel(
     """
     **Public** — Returns a single hotel with all its rooms.
 
-    Uses `selectinload` to eagerly load rooms in a single query
-    (avoids N+1).
+    Uses `joinedload` so the hotel and its rooms come back in one
+    LEFT OUTER JOIN query — for a single parent row that's one DB
+    round-trip instead of the two `selectinload` would issue.
     """
-    stmt = (
-        select(Hotel)
-        .where(Hotel.id == hotel_id)
-        .options(selectinload(Hotel.rooms))  # type: ignore[arg-type]
+    result = await session.execute(
+        _STMT_HOTEL_DETAIL, {"hotel_id": hotel_id}
     )
-    result = await session.execute(stmt)
-    hotel = result.scalar_one_or_none()
+    hotel = result.unique().scalar_one_or_none()
 
     if not hotel:
         raise HTTPException(
@@ -174,25 +255,107 @@ async def get_hotel(
 async def add_room(
     hotel_id: int,
     room_in: RoomCreate,
-    current_user: Annotated[User, Depends(require_hotel_role)],
+    current_user: Annotated[SimpleNamespace, Depends(require_hotel_role)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
     """
     **Protected** — Only the hotel's owner (or admin) can add rooms.
 
-    Critical ownership check: verifies `current_user.id` matches
-    the hotel's `owner_id` before allowing the operation.
-    Admins bypass this check.
+    The ownership check and the insert run as a single
+    `INSERT ... SELECT ... RETURNING` statement: the row is only
+    inserted if the hotel exists and belongs to the caller (admins
+    bypass the owner predicate). One round-trip on the happy path
+    instead of the old fetch / check / insert / refresh sequence.
     """
-    # ── Fetch hotel ─────────────────────────────────────────────
+    src = (
+        select(
+            literal(hotel_id),
+            literal(room_in.room_type),
+            literal(room_in.price_per_night),
+            literal(room_in.capacity),
+            literal(room_in.is_available),
+        )
+        .select_from(Hotel)
+        .where(Hotel.id == hotel_id)
+    )
+    if current_user.role != UserRole.ADMIN:
+        src = src.where(Hotel.owner_id == current_user.id)
+
+    stmt = (
+        insert(Room)
+        .from_select(
+            ["hotel_id", "room_type", "price_per_night", "capacity",
+             "is_available"],
+            src,
+        )
+        .returning(
+            Room.id,
+            Room.hotel_id,
+            Room.room_type,
+            Room.price_per_night,
+            Room.capacity,
+            Room.is_available,
+        )
+    )
+    result = await session.execute(stmt)
+    row = result.first()
+
+    if row is None:
+        # Error path only: one light probe to tell 404 from 403.
+        exists = await session.scalar(
+            select(Hotel.id).where(Hotel.id == hotel_id).limit(1)
+        )
+        if exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Hotel with id {hotel_id} not found.",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only add rooms to your own hotel.",
+        )
+
+    await session.commit()
+    return dict(row._mapping)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# ADD ROOMS IN BULK
+# ═══════════════════════════════════════════════════════════════════
+
+@router.post(
+    "/{hotel_id}/rooms/bulk",
+    response_model=list[RoomResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Add multiple rooms to a hotel in one request",
+)
+async def add_rooms_bulk(
+    hotel_id: int,
+    rooms_in: list[RoomCreate],
+    current_user: Annotated[SimpleNamespace, Depends(require_hotel_role)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """
+    **Protected** — Only the hotel's owner (or admin) can add rooms.
+
+    Bulk variant of the single-room endpoint for onboarding: one
+    ownership check, one multi-row INSERT (SQLAlchemy's
+    "insertmanyvalues"), one commit — instead of one full HTTP + DB
+    round-trip per room.
+    """
+    if not rooms_in:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Room list must not be empty.",
+        )
+
+    # ── Fetch hotel + ownership check (admins can bypass) ───────
     hotel = await session.get(Hotel, hotel_id)
     if not hotel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hotel with id {hotel_id} not found.",
         )
-
-    # ── Ownership check (admins can bypass) ─────────────────────
     if (
         current_user.role != UserRole.ADMIN
         and hotel.owner_id != current_user.id
@@ -202,16 +365,12 @@ async def add_room(
             detail="You can only add rooms to your own hotel.",
         )
 
-    # ── Create room ─────────────────────────────────────────────
-    db_room = Room(
-        hotel_id=hotel_id,
-        room_type=room_in.room_type,
-        price_per_night=room_in.price_per_night,
-        capacity=room_in.capacity,
-        is_available=room_in.is_available,
-    )
-    session.add(db_room)
+    # ── Single multi-row INSERT ... RETURNING ───────────────────
+    values = [
+        room.model_dump() | {"hotel_id": hotel_id} for room in rooms_in
+    ]
+    result = await session.scalars(insert(Room).returning(Room), values)
+    db_rooms = result.all()
     await session.commit()
-    await session.refresh(db_room)
 
-    return db_room
+    return db_rooms
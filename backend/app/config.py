@@ -5,6 +5,8 @@ Loads settings from environment variables / .env file.
 All secrets live in .env — never hardcoded.
 """
 
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,7 +27,7 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
 
     # ── Derived ─────────────────────────────────────────────────
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Async PostgreSQL connection string (for app runtime)."""
         return (
@@ -33,7 +35,7 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
-    @property
+    @cached_property
     def sync_database_url(self) -> str:
         """Sync PostgreSQL connection string (for Alembic migrations)."""
         return (
@@ -44,14 +46,15 @@ class Settings(BaseSettings):
     # ── CORS ────────────────────────────────────────────────────
     CORS_ORIGINS: str = "http://localhost:3000"
 
-    @property
+    @cached_property
     def cors_origin_list(self) -> list[str]:
-        """Parse comma-separated origins into a list."""
+        """Parse comma-separated origins into a list (computed once)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
     # ── App ─────────────────────────────────────────────────────
     APP_NAME: str = "GB Guide API"
     DEBUG: bool = True
+    PRODUCTION: bool = False
 
     # ── JWT Authentication ──────────────────────────────────────
     JWT_SECRET_KEY: str = "change-me-to-a-very-long-random-string-in-production"
@@ -59,5 +62,17 @@ class Settings(BaseSettings):
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    Usable as a FastAPI dependency (`Depends(get_settings)`) and by test
+    fixtures — the lru_cache guarantees the .env file is parsed exactly
+    once per process.
+    """
+    return Settings()
+
+
 # Singleton instance
-settings = Settings()
+settings = get_settings()
@@ -5,12 +5,17 @@ Password hashing, JWT creation/verification, and the
 `get_current_user` FastAPI dependency.
 """
 
+import asyncio
+import hashlib
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from typing import Annotated
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
@@ -23,17 +28,46 @@ from app.models import User, UserRole
 # PASSWORD HASHING
 # ═══════════════════════════════════════════════════════════════════
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id is the primary scheme; bcrypt stays registered so hashes created
+# before the switch keep verifying. Login upgrades them: on a successful
+# verify, verify_and_update_password returns a replacement argon2id hash
+# and the login route writes it back, so legacy accounts pay the ~250 ms
+# bcrypt cost once, not on every login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=3,
+    argon2__memory_cost=4096,
+    argon2__parallelism=1,
+)
+
 
+async def hash_password(plain_password: str) -> str:
+    """
+    Hash a plaintext password using argon2id.
 
-def hash_password(plain_password: str) -> str:
-    """Hash a plaintext password using bcrypt."""
-    return pwd_context.hash(plain_password)
+    Runs in a worker thread — password hashing is deliberately slow
+    (tens of ms), and doing it inline would block the event loop for
+    every concurrent request.
+    """
+    return await asyncio.to_thread(pwd_context.hash, plain_password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against its bcrypt hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+) -> tuple[bool, str | None]:
+    """
+    Verify a plaintext password against its hash (in a worker thread).
+
+    Returns ``(valid, new_hash)``. ``new_hash`` is a replacement
+    argon2id hash when the stored one uses a deprecated scheme (legacy
+    bcrypt) — the caller must persist it, or the account keeps paying
+    the bcrypt cost on every login.
+    """
+    return await asyncio.to_thread(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -82,37 +116,94 @@ credentials_exception = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+# Short-lived per-token cache so repeated requests from the same client
+# skip the JWT decode + user SELECT. 60s TTL keeps revocation lag small
+# (well under the 30-minute token lifetime). Keyed by a digest of the raw
+# token so the cache never stores usable credentials.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_user_cache_lock = asyncio.Lock()
+
+# We issue our own tokens, so decode verifies exactly what we put in:
+# signature + exp, required claims, and nothing else (no aud/iss work).
+_JWT_DECODE_OPTIONS = {
+    "require": ["exp", "sub"],
+    "verify_aud": False,
+    "verify_iss": False,
+}
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> User:
+) -> SimpleNamespace:
     """
-    FastAPI dependency: decode the JWT, look up the user, and return
-    the User ORM object. Raises 401 if anything fails.
+    FastAPI dependency: decode the JWT, confirm the user exists, and
+    return a lightweight namespace with just ``id`` and ``role`` — the
+    only attributes routes actually use. Raises 401 if anything fails.
+
+    Hydrating the full User row (password_hash, full_name, ...) on every
+    authenticated request is wasted bandwidth; routes that need the whole
+    profile should depend on `get_current_user_full` instead.
 
     Usage in a route:
-        @router.get("/me")
-        async def me(user: User = Depends(get_current_user)):
+        @router.get("/mine")
+        async def mine(user = Depends(get_current_user)):
             ...
     """
+    cache_key = _token_cache_key(token)
+    async with _user_cache_lock:
+        cached = _user_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
+        # Cheap header pre-check: reject malformed tokens and algorithm
+        # confusion attempts before paying for the HMAC verification.
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") != settings.JWT_ALGORITHM:
+            raise credentials_exception
+
         payload = jwt.decode(
             token,
             settings.JWT_SECRET_KEY,
             algorithms=[settings.JWT_ALGORITHM],
+            options=_JWT_DECODE_OPTIONS,
         )
         user_id: str | None = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
 
-    # Fetch user from DB
-    user = await session.get(User, int(user_id))
-    if user is None:
+    # Fetch only the columns the request path needs
+    result = await session.execute(
+        select(User.id, User.role).where(User.id == int(user_id))
+    )
+    row = result.first()
+    if row is None:
         raise credentials_exception
 
+    user = SimpleNamespace(id=row.id, role=row.role)
+    async with _user_cache_lock:
+        _user_cache[cache_key] = user
+    return user
+
+
+async def get_current_user_full(
+    current_user: Annotated[SimpleNamespace, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> User:
+    """
+    FastAPI dependency: the full User ORM object for routes that return
+    the whole profile (e.g. /me). Always hits the database — no caching.
+    """
+    user = await session.get(User, current_user.id)
+    if user is None:
+        raise credentials_exception
     return user
 
 
@@ -143,8 +234,8 @@ class RoleChecker:
 
     async def __call__(
         self,
-        current_user: Annotated[User, Depends(get_current_user)],
-    ) -> User:
+        current_user: Annotated[SimpleNamespace, Depends(get_current_user)],
+    ) -> SimpleNamespace:
         if current_user.role not in self.allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -4,33 +4,98 @@ GB Guide — Database Engine & Session
 Uses async SQLAlchemy with asyncpg driver.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from contextvars import ContextVar
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import SQLModel
 
 from app.config import settings
 import app.models  # noqa: F401  — registers all tables with SQLModel.metadata
 
 # ── Engine ──────────────────────────────────────────────────────
+# Pool is sized for ~20 steady connections + 10 burst overflow.
+# With multiple uvicorn workers, keep (pool_size + max_overflow) × workers
+# below PostgreSQL's max_connections.
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.DEBUG,
+    echo=settings.DEBUG and not settings.PRODUCTION,
     future=True,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,       # drop dead connections before handing them out
+    pool_recycle=1800,        # recycle before idle-timeout kills them server-side
+    query_cache_size=1200,    # compiled-SQL cache (default 500) — keep every
+                              # hot statement's compilation cached for good
+    connect_args={
+        # Cache PREPARE'd statements per connection so asyncpg skips
+        # re-parsing the same hot queries (login, auth lookups, lists).
+        "prepared_statement_cache_size": 200,
+    },
 )
 
 # ── Session Factory ─────────────────────────────────────────────
-async_session = sessionmaker(
+# autoflush=False: our routes flush explicitly via commit(); skipping the
+# implicit flush before every select() helps read-heavy endpoints.
+async_session = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,
+    autoflush=False,
+)
+
+
+# ── Request-Scoped Session ──────────────────────────────────────
+# One session per request, opened by the middleware in main.py and
+# shared by every dependency/route in that request via a ContextVar.
+# This avoids the async-generator setup/teardown per Depends() and the
+# duplicate-session problem when several dependencies need the DB.
+request_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "gbg_request_session",
+    default=None,
 )
 
 
-# ── Dependency ──────────────────────────────────────────────────
-async def get_session() -> AsyncSession:  # type: ignore[misc]
-    """FastAPI dependency that yields a DB session."""
-    async with async_session() as session:
-        yield session
+async def get_session() -> AsyncSession:
+    """FastAPI dependency that returns the request-scoped DB session."""
+    session = request_session.get()
+    if session is None:
+        raise RuntimeError(
+            "No request-scoped session — get_session() must be called "
+            "inside a request handled by the db_session_middleware."
+        )
+    return session
+
+
+# ── Bulk Insert (seeders / admin imports) ───────────────────────
+async def bulk_insert(
+    session: AsyncSession,
+    model: type[SQLModel],
+    rows: Sequence[dict[str, Any]],
+) -> None:
+    """
+    Insert many rows of `model` in one statement.
+
+    For seed scripts and admin imports — not request handlers. Uses a
+    single executemany-style INSERT (SQLAlchemy batches it via
+    insertmanyvalues) instead of one ORM INSERT per row, and relaxes
+    `synchronous_commit` for the transaction so the commit doesn't wait
+    for WAL fsync. SET LOCAL resets automatically at transaction end;
+    durability of other transactions is unaffected.
+
+    Keep the row dicts minimal — server-side defaults (id, created_at)
+    fill in on the database.
+    """
+    if not rows:
+        return
+    await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+    await session.execute(insert(model), list(rows))
+    await session.commit()
 
 
 # ── Table Creation (dev convenience) ────────────────────────────
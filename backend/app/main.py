@@ -8,9 +8,10 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.database import create_db_and_tables
+from app.database import async_session, create_db_and_tables, request_session
 from app.routers.health import router as health_router
 from app.api.routes.auth import router as auth_router
 from app.api.routes.hotels import router as hotels_router
@@ -20,8 +21,12 @@ from app.api.routes.hotels import router as hotels_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown hooks."""
-    # Startup: create tables (dev only — use Alembic in prod)
-    await create_db_and_tables()
+    # Startup: create tables — dev convenience only. In production this
+    # is skipped entirely: with multiple uvicorn workers each one would
+    # race the same CREATE TABLE IF NOT EXISTS on deploy and pay a
+    # metadata round-trip at boot. Run Alembic before workers start.
+    if settings.DEBUG and not settings.PRODUCTION:
+        await create_db_and_tables()
     yield
     # Shutdown: add cleanup here if needed
 
@@ -32,13 +37,37 @@ app = FastAPI(
     version="0.1.0",
     description="Backend API for GB Guide — serves Web & Mobile clients.",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,   # C-extension JSON encoder
 )
 
 
+# ── DB Session Middleware ───────────────────────────────────────
+@app.middleware("http")
+async def db_session_middleware(request, call_next):
+    """
+    Open one DB session per request and expose it via a ContextVar
+    (see `app.database.get_session`). Creating the session is cheap —
+    a pooled connection is only checked out on first query, so routes
+    that never touch the DB (e.g. /api/health) pay ~nothing.
+    """
+    async with async_session() as session:
+        token = request_session.set(session)
+        try:
+            return await call_next(request)
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            request_session.reset(token)
+
+
 # ── CORS Middleware ─────────────────────────────────────────────
+# Note: '*' is deliberately NOT appended — browsers reject a wildcard
+# origin combined with allow_credentials=True, and its presence forces
+# the middleware down the slower per-request origin-echo path.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origin_list + ["*"],   # '*' for dev ease
+    allow_origins=settings.cors_origin_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
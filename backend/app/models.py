@@ -15,8 +15,8 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlmodel import Field, Relationship, SQLModel, Column
-from sqlalchemy import Text, Enum as SAEnum
-from sqlalchemy.dialects.postgresql import ARRAY, VARCHAR
+from sqlalchemy import TIMESTAMP, Enum as SAEnum, Index, Text, desc, func, text
+from sqlalchemy.ext.orderinglist import ordering_list
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -39,6 +39,24 @@ class VerificationStatus(str, enum.Enum):
     REJECTED = "rejected"
 
 
+def _str_enum(enum_cls: type[enum.Enum], constraint_name: str) -> SAEnum:
+    """
+    Enum column stored as VARCHAR(20) + named CHECK constraint.
+
+    Same validation as a native PG enum type without the ALTER TYPE
+    migration pain, and — unlike a bare String column — values still
+    round-trip as Python enum members when rows load.
+    """
+    return SAEnum(
+        enum_cls,
+        native_enum=False,
+        length=20,
+        create_constraint=True,
+        values_callable=lambda e: [member.value for member in e],
+        name=constraint_name,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════
 # USER
 # ═══════════════════════════════════════════════════════════════════
@@ -49,17 +67,27 @@ class User(SQLModel, table=True):
     The `role` field determines which child relationships are meaningful.
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # Case-insensitive uniqueness + indexed login lookups. Routes
+        # lowercase the input and compare against lower(email).
+        Index("ix_users_email_lower", text("lower(email)"), unique=True),
+    )
+    # Fetch server-generated values (id, created_at, role default) in the
+    # INSERT's RETURNING clause — no follow-up SELECT on create. 2.0's
+    # "auto" already does this on PostgreSQL; True states the intent.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(
-        index=True,
-        unique=True,
         max_length=255,
-        description="Login email — must be unique.",
+        description="Login email — unique case-insensitively.",
     )
     password_hash: str = Field(
-        max_length=255,
-        description="Bcrypt / Argon2 hash — never store plaintext.",
+        # Argon2id hashes are ≤ ~100 chars, legacy bcrypt exactly 60 —
+        # 128 is a snug fit and keeps user tuples dense, which matters
+        # because this table is read on every authenticated request.
+        max_length=128,
+        description="Argon2id (or legacy bcrypt) hash — never store plaintext.",
     )
     full_name: str = Field(max_length=150)
     city: Optional[str] = Field(default=None, max_length=100)
@@ -67,24 +95,29 @@ class User(SQLModel, table=True):
     role: UserRole = Field(
         default=UserRole.CUSTOMER,
         sa_column=Column(
-            SAEnum(
-                UserRole,
-                name="userrole",
-                create_constraint=True,
-                values_callable=lambda e: [member.value for member in e],
-            ),
+            _str_enum(UserRole, "ck_users_role"),
             nullable=False,
             server_default=UserRole.CUSTOMER.value,
         ),
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            TIMESTAMP(timezone=True),
+            server_default=func.now(),
+            nullable=False,
+        ),
+    )
 
     # ── Relationships ───────────────────────────────────────────
+    # hotels/cars deliberately stay lazy: making them eager by default
+    # would drag a user's whole portfolio into every query that touches
+    # a User row (e.g. auth lookups). Routes eager-load explicitly.
     hotels: List["Hotel"] = Relationship(back_populates="owner")
     cars: List["Car"] = Relationship(back_populates="owner")
     guide_profile: Optional["GuideProfile"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"uselist": False},
+        sa_relationship_kwargs={"uselist": False, "lazy": "joined"},
     )
 
 
@@ -95,9 +128,24 @@ class User(SQLModel, table=True):
 class Hotel(SQLModel, table=True):
     """
     A hotel listed by a HOTEL_OWNER user.
-    Images are stored as a PostgreSQL text[] array of URLs.
+    Gallery images live in the hotel_images child table (one row per
+    image) — see HotelImage. The `images` property still exposes the
+    plain URL list the API schemas expect.
     """
     __tablename__ = "hotels"
+    __table_args__ = (
+        # Serves the listing's WHERE lower(city) = ? ORDER BY created_at
+        # DESC in one pass. The expression must match the query — a
+        # b-tree on raw city is useless for a lower(city) predicate.
+        # No separate lower(city) index: it'd be a redundant prefix.
+        Index(
+            "ix_hotels_city_created",
+            text("lower(city)"),
+            desc(text("created_at")),
+        ),
+    )
+    # See User — server defaults come back via INSERT ... RETURNING.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     owner_id: int = Field(foreign_key="users.id", index=True)
@@ -114,15 +162,68 @@ class Hotel(SQLModel, table=True):
         default=None,
         sa_column=Column(Text, nullable=True),
     )
-    images: Optional[List[str]] = Field(
+    created_at: Optional[datetime] = Field(
         default=None,
-        sa_column=Column(ARRAY(VARCHAR), nullable=True),
+        sa_column=Column(
+            TIMESTAMP(timezone=True),
+            server_default=func.now(),
+            nullable=False,
+        ),
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
 
     # ── Relationships ───────────────────────────────────────────
+    # rooms is selectin-eager: HotelResponse serializes it via
+    # from_attributes, so a lazy default would mean one SELECT per hotel
+    # (N+1) anywhere a detail schema walks the attribute. image_rows is
+    # eager for the same reason — the `images` property reads it.
     owner: "User" = Relationship(back_populates="hotels")
-    rooms: List["Room"] = Relationship(back_populates="hotel")
+    rooms: List["Room"] = Relationship(
+        back_populates="hotel",
+        sa_relationship_kwargs={"lazy": "selectin"},
+    )
+    # ordering_list keeps `position` in sync with list order: inserts,
+    # removals, and reorders renumber only the rows that moved — each a
+    # per-row UPDATE instead of rewriting a whole gallery.
+    image_rows: List["HotelImage"] = Relationship(
+        back_populates="hotel",
+        sa_relationship_kwargs={
+            "lazy": "selectin",
+            "order_by": "HotelImage.position",
+            "collection_class": ordering_list("position"),
+            "cascade": "all, delete-orphan",
+        },
+    )
+
+    @property
+    def images(self) -> List[str]:
+        """Gallery URLs in display order — kept for API compatibility."""
+        return [image.url for image in self.image_rows]
+
+
+class HotelImage(SQLModel, table=True):
+    """
+    One gallery image of a hotel.
+
+    Normalized out of the old hotels.images text[] column: adding,
+    removing, or reordering one image is now a single-row write instead
+    of rewriting the whole array.
+    """
+    __tablename__ = "hotel_images"
+    __table_args__ = (
+        # Serves the per-hotel gallery load in display order. Deliberately
+        # NOT unique: ordering_list renumbers positions with per-row
+        # UPDATEs, which would transiently collide under a unique
+        # constraint (e.g. moving the last image to the front).
+        Index("ix_hotel_images_hotel_position", "hotel_id", "position"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    hotel_id: int = Field(foreign_key="hotels.id")
+    position: int = Field(description="0-based gallery order.")
+    url: str = Field(max_length=500)
+
+    # ── Relationships ───────────────────────────────────────────
+    hotel: "Hotel" = Relationship(back_populates="image_rows")
 
 
 class Room(SQLModel, table=True):
@@ -153,6 +254,19 @@ class Car(SQLModel, table=True):
     Requires admin verification before becoming visible.
     """
     __tablename__ = "cars"
+    __table_args__ = (
+        # Serves WHERE status = ? ORDER BY created_at DESC in one pass.
+        Index("ix_cars_status_created", "status", desc(text("created_at"))),
+        # The public listing only ever shows verified cars; a partial
+        # index stays tiny (and cached) however many rows sit pending.
+        Index(
+            "ix_cars_verified",
+            desc(text("created_at")),
+            postgresql_where=text("status = 'verified'"),
+        ),
+    )
+    # See User — server defaults come back via INSERT ... RETURNING.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     owner_id: int = Field(foreign_key="users.id", index=True)
@@ -166,12 +280,7 @@ class Car(SQLModel, table=True):
     status: VerificationStatus = Field(
         default=VerificationStatus.PENDING,
         sa_column=Column(
-            SAEnum(
-                VerificationStatus,
-                name="verificationstatus",
-                create_constraint=True,
-                values_callable=lambda e: [member.value for member in e],
-            ),
+            _str_enum(VerificationStatus, "ck_cars_status"),
             nullable=False,
             server_default=VerificationStatus.PENDING.value,
         ),
@@ -181,7 +290,14 @@ class Car(SQLModel, table=True):
         max_length=500,
         description="URL to uploaded driver license image.",
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            TIMESTAMP(timezone=True),
+            server_default=func.now(),
+            nullable=False,
+        ),
+    )
 
     # ── Relationships ───────────────────────────────────────────
     owner: "User" = Relationship(back_populates="cars")
@@ -195,8 +311,21 @@ class GuideProfile(SQLModel, table=True):
     """
     Extended profile for a GUIDE user.
     One-to-one with User — enforced via unique constraint on user_id.
+    Spoken languages live in the guide_languages child table; the
+    `languages` property exposes the plain list the API expects.
     """
     __tablename__ = "guide_profiles"
+    __table_args__ = (
+        # Public guide listings only show verified profiles — see the
+        # matching partial index on cars.
+        Index(
+            "ix_guides_verified",
+            desc(text("created_at")),
+            postgresql_where=text("status = 'verified'"),
+        ),
+    )
+    # See User — server defaults come back via INSERT ... RETURNING.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(
@@ -209,21 +338,10 @@ class GuideProfile(SQLModel, table=True):
         sa_column=Column(Text, nullable=True),
     )
     daily_rate: float = Field(description="Daily rate in PKR.")
-    languages: Optional[List[str]] = Field(
-        default=None,
-        sa_column=Column(ARRAY(VARCHAR), nullable=True),
-        description="E.g. ['Urdu', 'English', 'Brushaski'].",
-    )
     status: VerificationStatus = Field(
         default=VerificationStatus.PENDING,
         sa_column=Column(
-            SAEnum(
-                VerificationStatus,
-                name="verificationstatus",
-                create_constraint=True,
-                create_type=False,       # re-use the type created by Car
-                values_callable=lambda e: [member.value for member in e],
-            ),
+            _str_enum(VerificationStatus, "ck_guides_status"),
             nullable=False,
             server_default=VerificationStatus.PENDING.value,
         ),
@@ -233,7 +351,47 @@ class GuideProfile(SQLModel, table=True):
         max_length=500,
         description="URL to uploaded CNIC image for verification.",
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            TIMESTAMP(timezone=True),
+            server_default=func.now(),
+            nullable=False,
+        ),
+    )
+
+    # ── Relationships ───────────────────────────────────────────
+    user: "User" = Relationship(
+        back_populates="guide_profile",
+        sa_relationship_kwargs={"lazy": "joined"},
+    )
+    language_rows: List["GuideLanguage"] = Relationship(
+        back_populates="guide",
+        sa_relationship_kwargs={
+            "lazy": "selectin",
+            "order_by": "GuideLanguage.lang",
+            "cascade": "all, delete-orphan",
+        },
+    )
+
+    @property
+    def languages(self) -> List[str]:
+        """Spoken languages — e.g. ['Urdu', 'English', 'Brushaski']."""
+        return [row.lang for row in self.language_rows]
+
+
+class GuideLanguage(SQLModel, table=True):
+    """
+    One language spoken by a guide.
+
+    Normalized out of the old guide_profiles.languages text[] column so
+    exact-language lookups use the composite-PK B-tree (cheaper than a
+    GIN probe) and adding a language is a single-row insert.
+    """
+    __tablename__ = "guide_languages"
+
+    guide_id: int = Field(foreign_key="guide_profiles.id", primary_key=True)
+    lang: str = Field(primary_key=True, max_length=50)
 
     # ── Relationships ───────────────────────────────────────────
-    user: "User" = Relationship(back_populates="guide_profile")
+    guide: "GuideProfile" = Relationship(back_populates="language_rows")
@@ -0,0 +1,52 @@
+"""
+GB Guide — Shared Schema Base
+
+Common Pydantic configuration for response schemas so every class
+doesn't re-declare (and pydantic doesn't re-derive) the same config.
+
+Note on __slots__: Pydantic v2 has no ConfigDict option for slotted
+models (only `pydantic.dataclasses.dataclass(slots=True)` supports it,
+and converting the request schemas would lose model_validate/model_dump
+that the routes rely on). Per-instance overhead is already small —
+pydantic-core keeps field data in its own Rust-side storage.
+"""
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, PlainSerializer, StringConstraints
+
+# Email input type. EmailStr pulls in email-validator (and idna) and
+# does Python-level parsing on every request; this pattern is checked by
+# pydantic-core's compiled regex in Rust. `to_lower` canonicalizes at
+# the boundary so routes never need to call .lower() themselves — the
+# DB compares against lower(email) anyway.
+EmailField = Annotated[
+    str,
+    StringConstraints(
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+        max_length=255,
+        to_lower=True,
+    ),
+]
+
+# Timestamp output type. PlainSerializer replaces pydantic's default
+# datetime serializer (which re-derives the format per value) with a
+# direct isoformat() call; `when_used="json"` keeps Python-mode dumps
+# as real datetime objects, e.g. for the cursor arithmetic in routes.
+ISODateTime = Annotated[
+    datetime,
+    PlainSerializer(datetime.isoformat, return_type=str, when_used="json"),
+]
+
+
+class ORMModel(BaseModel):
+    """
+    Base for response schemas populated from ORM objects.
+
+    `from_attributes` lets FastAPI build the schema straight from a
+    SQLModel row; `extra="ignore"` skips validation work for attributes
+    the schema doesn't declare.
+    """
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
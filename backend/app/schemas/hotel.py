@@ -6,10 +6,11 @@ HotelResponse nests RoomResponse so a single GET returns
 the hotel + all its rooms.
 """
 
-from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.schemas.base import ISODateTime, ORMModel
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -37,7 +38,7 @@ class RoomCreate(BaseModel):
     is_available: bool = Field(default=True)
 
 
-class RoomResponse(BaseModel):
+class RoomResponse(ORMModel):
     """Room data returned to the client."""
     id: int
     hotel_id: int
@@ -46,8 +47,6 @@ class RoomResponse(BaseModel):
     capacity: int
     is_available: bool
 
-    model_config = {"from_attributes": True}
-
 
 # ═══════════════════════════════════════════════════════════════════
 # HOTEL SCHEMAS
@@ -83,7 +82,7 @@ class HotelCreate(BaseModel):
     )
 
 
-class HotelResponse(BaseModel):
+class HotelResponse(ORMModel):
     """
     Hotel data returned to the client.
     Includes nested rooms for detail views.
@@ -95,13 +94,11 @@ class HotelResponse(BaseModel):
     city: str
     description: Optional[str] = None
     images: Optional[list[str]] = None
-    created_at: datetime
+    created_at: ISODateTime
     rooms: list[RoomResponse] = []
 
-    model_config = {"from_attributes": True}
 
-
-class HotelListResponse(BaseModel):
+class HotelListResponse(ORMModel):
     """
     Lightweight hotel data for list views (no rooms).
     Avoids N+1 queries on the listing page.
@@ -113,6 +110,35 @@ class HotelListResponse(BaseModel):
     city: str
     description: Optional[str] = None
     images: Optional[list[str]] = None
-    created_at: datetime
+    created_at: ISODateTime
+
+
+class HotelListCursor(ORMModel):
+    """
+    Keyset cursor — `(created_at, id)` of the last item on a page.
+
+    The `id` tie-break matters: `created_at` defaults to `now()`, which
+    is transaction-stable, so every row of a batch insert shares one
+    timestamp and a timestamp-only cursor would skip the ties.
+    """
+    created_at: ISODateTime
+    id: int
+
+
+class HotelListPage(ORMModel):
+    """
+    One keyset-paginated page of the public hotel listing.
+    Pass `next_cursor` back as the `cursor` / `cursor_id` query
+    parameters to fetch the next page. None means there are no more
+    pages.
+    """
+    items: list[HotelListResponse]
+    next_cursor: Optional[HotelListCursor] = None
+
 
-    model_config = {"from_attributes": True}
+# Built once at import — the list endpoint reuses this adapter instead of
+# letting FastAPI construct validators per call. Validation runs in
+# pydantic-core's compiled list loop; dumping goes through HotelListPage.
+HOTEL_LIST_ADAPTER: TypeAdapter[list[HotelListResponse]] = TypeAdapter(
+    list[HotelListResponse]
+)
@@ -5,9 +5,9 @@ Separate from SQLModel table models — these control what the API
 accepts (input) and returns (output). Never expose password_hash.
 """
 
-from datetime import datetime
+from pydantic import BaseModel, Field
 
-from pydantic import BaseModel, EmailStr, Field
+from app.schemas.base import EmailField, ISODateTime, ORMModel
 
 from app.models import UserRole
 
@@ -18,7 +18,7 @@ from app.models import UserRole
 
 class UserCreate(BaseModel):
     """Schema for user registration."""
-    email: EmailStr
+    email: EmailField
     password: str = Field(min_length=8, max_length=128)
     full_name: str = Field(min_length=1, max_length=150)
     city: str | None = Field(default=None, max_length=100)
@@ -30,7 +30,7 @@ class UserCreate(BaseModel):
 # OUTPUT SCHEMAS
 # ═══════════════════════════════════════════════════════════════════
 
-class UserResponse(BaseModel):
+class UserResponse(ORMModel):
     """
     Schema returned to the client.
     Deliberately excludes password_hash.
@@ -41,9 +41,7 @@ class UserResponse(BaseModel):
     city: str | None = None
     phone_number: str | None = None
     role: UserRole
-    created_at: datetime
-
-    model_config = {"from_attributes": True}
+    created_at: ISODateTime
 
 
 # ═══════════════════════════════════════════════════════════════════
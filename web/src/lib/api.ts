@@ -176,9 +176,31 @@ export async function createHotel(
     });
 }
 
-export async function listHotels(city?: string): Promise<HotelResponse[]> {
-    const query = city ? `?city=${encodeURIComponent(city)}` : "";
-    return apiFetch<HotelResponse[]>(`/api/hotels${query}`);
+export interface HotelListCursor {
+    /** created_at of the last item on the page. */
+    created_at: string;
+    /** id of the last item — tie-break for rows sharing a timestamp. */
+    id: number;
+}
+
+export interface HotelListPage {
+    items: HotelResponse[];
+    /** Keyset cursor of the last item — pass back to fetch the next page. */
+    next_cursor: HotelListCursor | null;
+}
+
+export async function listHotels(
+    city?: string,
+    cursor?: HotelListCursor,
+): Promise<HotelListPage> {
+    const params = new URLSearchParams();
+    if (city) params.set("city", city);
+    if (cursor) {
+        params.set("cursor", cursor.created_at);
+        params.set("cursor_id", String(cursor.id));
+    }
+    const query = params.size > 0 ? `?${params.toString()}` : "";
+    return apiFetch<HotelListPage>(`/api/hotels${query}`);
 }
 
 export async function getHotel(hotelId: number): Promise<HotelResponse> {